@@ -1,21 +1,32 @@
 import os
 from pathlib import Path
 
-def print_tree(directory):
-    print(f"\n📂 Inspecting: {directory}")
-    if not directory.exists():
-        print("   ❌ Folder not found!")
-        return
+def print_tree(directory, level=0):
+    if level == 0:
+        print(f"\n📂 Inspecting: {directory}")
+        if not directory.exists():
+            print("   ❌ Folder not found!")
+            return
 
-    for root, dirs, files in os.walk(directory):
-        level = root.replace(str(directory), '').count(os.sep)
-        indent = ' ' * 4 * (level)
-        print(f"{indent}📁 {os.path.basename(root)}/")
-        subindent = ' ' * 4 * (level + 1)
-        for f in files:
-            file_path = Path(root) / f
-            size_mb = file_path.stat().st_size / (1024 * 1024)
-            print(f"{subindent}📄 {f} ({size_mb:.2f} MB)")
+    indent = ' ' * 4 * (level)
+    print(f"{indent}📁 {os.path.basename(directory)}/")
+    subindent = ' ' * 4 * (level + 1)
+
+    # The entry type usually comes with the directory read; sizes still cost
+    # one stat() per file. Directory symlinks are neither followed nor listed,
+    # as with os.walk.
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                size_mb = entry.stat().st_size / (1024 * 1024)
+                print(f"{subindent}📄 {entry.name} ({size_mb:.2f} MB)")
+
+    for sub in subdirs:
+        print_tree(sub, level + 1)
 
 if __name__ == "__main__":
     base_path = Path("../data/raw").resolve()
@@ -23,4 +34,4 @@ if __name__ == "__main__":
     print("DIGITAL GENOME DATA DIAGNOSTICS")
     print("="*60)
     print_tree(base_path)
-    print("="*60)
\ No newline at end of file
+    print("="*60)
@@ -110,38 +110,44 @@ def main():
     
     current_buffer_size = INITIAL_BUFFER_SIZE
     archetype_buffer = torch.empty((current_buffer_size, vec_dim), device=device)
+    # Squared norms of the archetypes, kept in sync with archetype_buffer so
+    # distances reduce to one GEMM: |b-a|^2 = |b|^2 + |a|^2 - 2 b.a
+    arch_sq = torch.empty(current_buffer_size, device=device)
     archetype_count = 0
-    golden_prototypes = [] 
+    selected_idx = []  # Global indices into valid_genes; gathered once at the end
     
     if len(nominal_indices) > 0:
         nominal_tensor = full_tensor[nominal_indices]
+        nominal_idx_cpu = torch.tensor(nominal_indices, dtype=torch.long)
         
         pbar = tqdm(total=len(nominal_indices), unit="vec", desc="Consolidating")
         
         for i in range(0, len(nominal_indices), BATCH_SIZE):
             batch = nominal_tensor[i : i+BATCH_SIZE]
-            batch_indices = nominal_indices[i : i+BATCH_SIZE]
+            batch_indices = nominal_idx_cpu[i : i+BATCH_SIZE]
             
             # First initialization
             if archetype_count == 0:
                 archetype_buffer[0] = batch[0]
+                arch_sq[0] = (batch[0] * batch[0]).sum()
                 archetype_count = 1
-                golden_prototypes.append(valid_genes[batch_indices[0]])
+                selected_idx.append(int(batch_indices[0]))
             
-            # Compare Batch vs Current Archetypes
+            # Compare Batch vs Current Archetypes (squared distances via matmul)
             current_archs = archetype_buffer[:archetype_count]
-            dists = torch.cdist(batch, current_archs)
-            min_dists, _ = torch.min(dists, dim=1)
+            batch_sq = (batch * batch).sum(dim=1)
+            sq_dists = batch_sq[:, None] + arch_sq[None, :archetype_count] - 2.0 * (batch @ current_archs.T)
+            min_sq_dists, _ = torch.min(sq_dists.clamp_(min=0.0), dim=1)
             
             # Novelties
-            novel_mask = min_dists >= SIMILARITY_THRESHOLD
+            novel_mask = min_sq_dists >= SIMILARITY_THRESHOLD ** 2
             novel_local_indices = novel_mask.nonzero(as_tuple=True)[0]
             
             if len(novel_local_indices) > 0:
                 novel_vecs = batch[novel_local_indices]
                 
                 remaining = novel_vecs
-                rem_global_idxs = [batch_indices[x] for x in novel_local_indices.cpu().numpy()]
+                rem_global_idxs = batch_indices[novel_local_indices.cpu()]
                 
                 # Internal Loop
                 while len(remaining) > 0:
@@ -150,11 +156,15 @@ def main():
                         new_buf = torch.empty((new_size, vec_dim), device=device)
                         new_buf[:current_buffer_size] = archetype_buffer
                         archetype_buffer = new_buf
+                        new_sq = torch.empty(new_size, device=device)
+                        new_sq[:current_buffer_size] = arch_sq
+                        arch_sq = new_sq
                         current_buffer_size = new_size
                         
                     seed = remaining[0]
                     archetype_buffer[archetype_count] = seed
-                    golden_prototypes.append(valid_genes[rem_global_idxs[0]])
+                    arch_sq[archetype_count] = (seed * seed).sum()
+                    selected_idx.append(int(rem_global_idxs[0]))
                     archetype_count += 1
                     
                     # Vectorized removal
@@ -162,11 +172,13 @@ def main():
                     keep = d_int >= SIMILARITY_THRESHOLD
                     
                     remaining = remaining[keep]
-                    rem_global_idxs = [val for k, val in enumerate(rem_global_idxs) if keep[k].item()]
+                    rem_global_idxs = rem_global_idxs[keep.cpu()]
             
             pbar.update(len(batch))
         pbar.close()
 
+    golden_prototypes = [valid_genes[i] for i in selected_idx]
+
     # 4. TRAUMAS
     trauma_library = []
     if len(veto_indices) > 0:
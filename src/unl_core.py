@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Tuple
 import logging
 import math
+import re
 
 # Setup Logging
 logger = logging.getLogger("UNL_Core")
@@ -30,6 +31,14 @@ class OntologyType:
     NATURE = "nature"         # Fractal, Continuous, 1/f Noise
     ENTROPY = "pure_entropy"  # Randomness / Unknown
     VOID = "void"             # The "Lack of" -> Action of Non-Existence
+    UNKNOWN = "unknown"       # No signal and no recognizable metadata
+
+# Metadata keywords for the no-signal fallback in process_gene_rna
+_DESC_KEYWORDS = re.compile(
+    r"(?P<machine>turb|engine|sensor)|(?P<human>user|loan)|(?P<nature>rain|weather)",
+    re.IGNORECASE
+)
+_SRC_HUMAN_KEYWORDS = re.compile(r"bpi", re.IGNORECASE)
 
 class SemanticIntent:
     # Normalized intents based on signal direction
@@ -37,7 +46,7 @@ class SemanticIntent:
     OBSERVE = "observe"     # (Input/Sensor)
     STABILIZE = "stabilize" # (Resistance to Change)
 
-@dataclass
+@dataclass(frozen=True)
 class HarmonicSignature:
     """The mathematical shape of the entity based on its signal topology."""
     periodicity: float  # 0.0 (Chaos) to 1.0 (Metronome)
@@ -46,37 +55,156 @@ class HarmonicSignature:
     linearity: float    # R-squared of trend
     agency_type: str    # The inferred Ontology
 
+# scipy kernels (rfft, xlogy), imported on first engine construction:
+# importing scipy costs far more than this module and its other imports.
+_rfft = None
+_xlogy = None
+
+def _load_scipy_kernels() -> None:
+    """Binds the module-level scipy kernels once per process."""
+    global _rfft, _xlogy
+    if _rfft is None:
+        from scipy.fft import rfft
+        from scipy.special import xlogy
+        _rfft, _xlogy = rfft, xlogy
+
+def _hist10(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise np.histogram(x, bins=10) over a (k, n) stack of signals.
+    Returns (counts, edges) of shapes (k, 10) and (k, 11). Bins follow
+    numpy exactly: edges come from linspace over [min, max] (a flat row is
+    widened to [v - 0.5, v + 0.5]), and the scale-and-truncate index is
+    moved by one wherever it disagrees with those edges, so values on or
+    near an edge land where np.histogram puts them.
+    """
+    lo = X.min(axis=1)
+    hi = X.max(axis=1)
+    if not (np.isfinite(lo).all() and np.isfinite(hi).all()):
+        raise ValueError("autodetected range of signal is not finite")
+    flat = lo == hi
+    if flat.any():
+        lo = np.where(flat, lo - 0.5, lo)
+        hi = np.where(flat, hi + 0.5, hi)
+    edges = np.linspace(lo, hi, 11, axis=1)
+
+    idx = ((X - lo[:, None]) * (10.0 / (hi - lo))[:, None]).astype(np.intp)
+    np.minimum(idx, 9, out=idx)  # the maximum belongs to the closed last bin
+    rows = np.arange(X.shape[0])[:, None]
+    idx -= (X < edges[rows, idx]).astype(np.intp)
+    idx += ((X >= edges[rows, idx + 1]) & (idx != 9)).astype(np.intp)
+
+    counts = np.bincount((idx + rows * 10).ravel(), minlength=10 * X.shape[0])
+    return counts.reshape(-1, 10), edges
+
+def _build_agency_lut() -> np.ndarray:
+    """
+    Tabulates the UNL-0 decision chain over its six threshold tests.
+    Index bits: 0 periodicity>0.3, 1 entropy<2.0, 2 volatility>0.5,
+    3 periodicity<0.2, 4 volatility<0.1, 5 periodicity<0.1.
+    """
+    lut = np.empty(64, dtype=object)
+    for idx in range(64):
+        p_high, e_low, v_high, p_low, v_low, p_none = ((idx >> bit) & 1 for bit in range(6))
+        
+        # These thresholds are the "Ears" of the UNL-0.
+        # MACHINE SIGNATURE: High Rhythm, Low Entropy (Ordered)
+        # Turbines vibrate at specific frequencies.
+        if p_high and e_low:
+            lut[idx] = OntologyType.MACHINE
+        # HUMAN SIGNATURE: High Volatility, Low Rhythm (Bursty/Transactional)
+        # Humans don't work in perfect cycles. They do big things, then wait.
+        elif v_high and p_low:
+            lut[idx] = OntologyType.HUMAN
+        # NATURE SIGNATURE: Moderate Entropy, Low Volatility (Smooth), No Rhythm
+        # Temperature/Pressure changes slowly and continuously.
+        elif v_low and p_none:
+            lut[idx] = OntologyType.NATURE
+        else:
+            lut[idx] = OntologyType.ENTROPY # Default to Unknown
+    return lut
+
+_AGENCY_LUT = _build_agency_lut()
+
+def _agency_index(periodicity, entropy, volatility):
+    """Packs the threshold tests into an _AGENCY_LUT index (scalars or arrays)."""
+    return (
+        (periodicity > 0.3) * 1
+        | (entropy < 2.0) * 2
+        | (volatility > 0.5) * 4
+        | (periodicity < 0.2) * 8
+        | (volatility < 0.1) * 16
+        | (periodicity < 0.1) * 32
+    )
+
+# Distinct signals remembered, shared by every engine. Validation runs
+# classify the same sample windows over and over; a repeat skips the
+# histogram and the FFT.
+SIGNATURE_CACHE_SIZE = 4096
+# Longest signal (in samples) that is cached. Keys are the raw float64 bytes,
+# so this bounds the cache to SIZE * MAX_LEN * 8 bytes of keys (16 MiB).
+SIGNATURE_CACHE_MAX_LEN = 512
+# Distinct window lengths whose scratch buffers are kept alive.
+SCRATCH_LENGTHS_MAX = 64
+# Row count above which classify_batch runs its FFT on every core.
+FFT_PARALLEL_MIN_ROWS = 16
+
+# Raw signal bytes -> HarmonicSignature, or only the agency when that is all
+# process_gene_rna asked for. Keyed on the exact bytes, so only exact repeats
+# hit and classification stays deterministic.
+_signature_cache: Dict[bytes, Any] = {}
+
+def _cache_signature(raw: bytes, value: Any) -> None:
+    """Remembers a signal's signature or agency (short signals only)."""
+    if len(raw) > SIGNATURE_CACHE_MAX_LEN * 8:
+        return
+    if len(_signature_cache) >= SIGNATURE_CACHE_SIZE:
+        _signature_cache.clear()
+    _signature_cache[raw] = value
+
 class UNLEngine:
     def __init__(self):
         logger.info("UNL-0 Core Online. Listening to the Silent Flute...")
+        _load_scipy_kernels()
+        # Per-length work buffers for the centered signal and FFT magnitudes.
+        self._scratch: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _get_scratch(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (real_buf[n], abs_buf[n//2+1]) reused across calls of length n."""
+        bufs = self._scratch.get(n)
+        if bufs is None:
+            if len(self._scratch) >= SCRATCH_LENGTHS_MAX:
+                self._scratch.clear()
+            bufs = (np.empty(n), np.empty(n // 2 + 1))
+            self._scratch[n] = bufs
+        return bufs
 
-    def _calculate_entropy(self, signal: List[float]) -> float:
+    def _calculate_entropy(self, signal: np.ndarray) -> float:
         """Calculates Shannon Entropy of a signal distribution."""
-        if not signal or len(signal) < 2: return 0.0
-        # Create histogram
-        hist, _ = np.histogram(signal, bins=10, density=True)
-        # Filter zeros to avoid log(0)
-        hist = hist[hist > 0]
-        return -np.sum(hist * np.log(hist))
-
-    def _calculate_periodicity(self, signal: List[float]) -> float:
+        n = signal.size
+        if n < 2: return 0.0
+        # Density histogram, as np.histogram(bins=10, density=True)
+        counts, edges = _hist10(signal[None, :])
+        hist = counts[0] / np.diff(edges[0]) / n
+        # xlogy yields 0 for empty bins (0*log 0), so no zero filtering is needed
+        return -_xlogy(hist, hist).sum()
+
+    def _calculate_periodicity(self, centered: np.ndarray) -> float:
         """
         Uses FFT (Fast Fourier Transform) to detect dominant cycles.
         Heuristic: Machines hum (peaks); Nature flows; Humans stutter.
-        """
-        if len(signal) < 4: return 0.0
         
-        # Remove DC component (mean)
-        sig_array = np.array(signal)
-        sig_array = sig_array - np.mean(sig_array)
+        Expects the signal with its DC component (mean) already removed.
+        """
+        if centered.size < 4: return 0.0
         
-        # FFT
-        fft_vals = np.absolute(np.fft.rfft(sig_array))
+        # FFT (scipy's pocketfft caches plans for repeated window lengths)
+        _, fft_vals = self._get_scratch(centered.size)
+        np.absolute(_rfft(centered, workers=1), out=fft_vals)
         
         # Peak strength vs Background noise
-        if np.sum(fft_vals) == 0: return 0.0
-        peak = np.max(fft_vals)
-        total = np.sum(fft_vals)
+        total = fft_vals.sum()
+        if total == 0: return 0.0
+        peak = fft_vals.max()
         
         # A pure sine wave has all energy in one peak (Ratio ~1.0)
         # White noise has energy spread everywhere (Ratio low)
@@ -89,44 +217,108 @@ class UNLEngine:
         """
         # 1. Handle "The Lack of" (Axiom 0)
         # If signal is empty or constant zero/null, it is a VOID action.
-        if not signal_stream or all(v == 0 for v in signal_stream):
+        sig_array = np.asarray(signal_stream, dtype=np.float64)
+        if sig_array.size == 0 or not sig_array.any():
             return HarmonicSignature(0, 0, 0, 1, OntologyType.VOID)
 
         # 2. Analyze Topology
-        sig_array = np.array(signal_stream)
+        raw = sig_array.tobytes()
+        signature = _signature_cache.get(raw)
+        if not isinstance(signature, HarmonicSignature):
+            signature = self._analyze_topology(raw)
+            _cache_signature(raw, signature)
+        return signature
+
+    def _center_and_volatility(self, sig_array: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Returns (centered, volatility). The centered array lives in the scratch
+        buffer and is shared with the FFT.
+        """
+        mean = sig_array.sum() / sig_array.size
+        centered, _ = self._get_scratch(sig_array.size)
+        np.subtract(sig_array, mean, out=centered)
+        std = math.sqrt(centered.dot(centered) / sig_array.size)
+        volatility = (std / mean) if mean != 0 else 0
+        return centered, volatility
+
+    def _classify_topology(self, raw: bytes) -> str:
+        """
+        Agency-only classification of a non-void float64 signal buffer,
+        cheapest statistic first. Entropy only enters the MACHINE test, which
+        also needs periodicity > 0.3, so it is skipped for every other signal.
+        """
+        sig_array = np.frombuffer(raw, dtype=np.float64)
+        centered, volatility = self._center_and_volatility(sig_array)
+        periodicity = self._calculate_periodicity(centered)
+        entropy = self._calculate_entropy(sig_array) if periodicity > 0.3 else math.inf
+        return _AGENCY_LUT[_agency_index(periodicity, entropy, volatility)]
+
+    def _analyze_topology(self, raw: bytes) -> HarmonicSignature:
+        """Computes the Harmonic Signature of a non-void float64 signal buffer."""
+        sig_array = np.frombuffer(raw, dtype=np.float64)
         
         # Volatility (Coefficient of Variation)
-        mean = np.mean(sig_array)
-        std = np.std(sig_array)
-        volatility = (std / mean) if mean != 0 else 0
+        centered, volatility = self._center_and_volatility(sig_array)
         
         # Entropy (Information Density)
-        entropy = self._calculate_entropy(signal_stream)
+        entropy = self._calculate_entropy(sig_array)
         
         # Periodicity (Rhythm)
-        periodicity = self._calculate_periodicity(signal_stream)
+        periodicity = self._calculate_periodicity(centered)
 
         # 3. Infer Ontology based on Signatures
-        # These thresholds are the "Ears" of the UNL-0.
+        # Branch-free: the threshold tests index the precomputed decision table.
+        agency = _AGENCY_LUT[_agency_index(periodicity, entropy, volatility)]
+        
+        return HarmonicSignature(periodicity, entropy, volatility, 0.0, agency)
+
+    def classify_batch(self, signals: List[Any]) -> List[str]:
+        """
+        Bulk form of infer_agency_from_signal(...).agency_type.
         
-        agency = OntologyType.ENTROPY # Default to Unknown
+        Signals of equal length are stacked into a (k, n) matrix so each
+        statistic (volatility, entropy, periodicity) is one vectorized pass
+        per length group instead of k Python-level calls.
+        """
+        arrays = [np.asarray(sig, dtype=np.float64) for sig in signals]
+        agencies = [OntologyType.VOID] * len(arrays)
         
-        # MACHINE SIGNATURE: High Rhythm, Low Entropy (Ordered)
-        # Turbines vibrate at specific frequencies.
-        if periodicity > 0.3 and entropy < 2.0:
-            agency = OntologyType.MACHINE
+        by_length: Dict[int, List[int]] = {}
+        for i, arr in enumerate(arrays):
+            if arr.size:
+                by_length.setdefault(arr.size, []).append(i)
+        
+        for n, members in by_length.items():
+            X = np.stack([arrays[i] for i in members])
             
-        # HUMAN SIGNATURE: High Volatility, Low Rhythm (Bursty/Transactional)
-        # Humans don't work in perfect cycles. They do big things, then wait.
-        elif volatility > 0.5 and periodicity < 0.2:
-            agency = OntologyType.HUMAN
+            # Volatility (Coefficient of Variation)
+            means = X.sum(axis=1) / n
+            centered = X - means[:, None]
+            stds = np.sqrt(np.einsum('ij,ij->i', centered, centered) / n)
+            volatility = np.divide(stds, means, out=np.zeros_like(stds), where=means != 0)
             
-        # NATURE SIGNATURE: Moderate Entropy, Low Volatility (Smooth), No Rhythm
-        # Temperature/Pressure changes slowly and continuously.
-        elif volatility < 0.1 and periodicity < 0.1:
-            agency = OntologyType.NATURE
+            # Entropy: per-row 10-bin density histogram (see _hist10)
+            entropy = np.zeros(len(members))
+            if n >= 2:
+                counts, edges = _hist10(X)
+                hist = counts / np.diff(edges, axis=1) / n
+                entropy = -_xlogy(hist, hist).sum(axis=1)
             
-        return HarmonicSignature(periodicity, entropy, volatility, 0.0, agency)
+            # Periodicity: one FFT call for the whole group; rows are
+            # independent, so larger groups are spread across all cores.
+            periodicity = np.zeros(len(members))
+            if n >= 4:
+                workers = -1 if len(members) >= FFT_PARALLEL_MIN_ROWS else 1
+                fft_vals = np.abs(_rfft(centered, axis=1, workers=workers, overwrite_x=True))
+                total = fft_vals.sum(axis=1)
+                np.divide(fft_vals.max(axis=1), total, out=periodicity, where=total != 0)
+            
+            labels = _AGENCY_LUT[_agency_index(periodicity, entropy, volatility)]
+            void = ~X.any(axis=1)
+            for row, i in enumerate(members):
+                agencies[i] = OntologyType.VOID if void[row] else str(labels[row])
+        
+        return agencies
 
     def process_gene_rna(self, gene_metadata: Dict, signal_sample: List[float]) -> str:
         """
@@ -137,16 +329,26 @@ class UNLEngine:
         # 1. Try Signal Topology First (UNL-0 / Pre-sensory)
         # This is the "Flute without Sound" - pure math.
         if signal_sample and len(signal_sample) > 5:
-            signature = self.infer_agency_from_signal(signal_sample)
-            return signature.agency_type
+            # Only the agency is needed here, not the full signature.
+            sig_array = np.asarray(signal_sample, dtype=np.float64)
+            if not sig_array.any():
+                return OntologyType.VOID
+            raw = sig_array.tobytes()
+            cached = _signature_cache.get(raw)
+            if cached is None:
+                cached = self._classify_topology(raw)
+                _cache_signature(raw, cached)
+            return cached.agency_type if isinstance(cached, HarmonicSignature) else cached
             
         # 2. Fallback to Metadata Analysis (if no signal available)
         # Strictly for initialization or empty genes
-        desc = gene_metadata.get("description", "").lower()
-        src = gene_metadata.get("source_file", "").lower()
+        # One case-insensitive scan of the description collects every keyword
+        # family; precedence stays Machine > Human > Nature.
+        found = {m.lastgroup for m in _DESC_KEYWORDS.finditer(gene_metadata.get("description", ""))}
         
-        if "turb" in desc or "engine" in desc or "sensor" in desc: return OntologyType.MACHINE
-        if "user" in desc or "loan" in desc or "bpi" in src: return OntologyType.HUMAN
-        if "rain" in desc or "weather" in desc: return OntologyType.NATURE
+        if "machine" in found: return OntologyType.MACHINE
+        if "human" in found or _SRC_HUMAN_KEYWORDS.search(gene_metadata.get("source_file", "")):
+            return OntologyType.HUMAN
+        if "nature" in found: return OntologyType.NATURE
         
         return OntologyType.UNKNOWN
\ No newline at end of file
@@ -22,13 +22,14 @@ Each loader implements the BaseLoader interface, ensuring consistent
 transformation pipelines across different data domains.
 """
 
-from .base_loader import BaseLoader, LoaderConfig, TransformationResult
+from .base_loader import BaseLoader, LoaderConfig, TransformationResult, CodonBatch
 from .bpi_loader import BPILoader, BPIConfig
 
 __all__ = [
     'BaseLoader',
     'LoaderConfig', 
     'TransformationResult',
+    'CodonBatch',
     'BPILoader',
     'BPIConfig',
 ]
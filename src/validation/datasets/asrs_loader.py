@@ -12,14 +12,40 @@ Relevance:
 - Validates the Praxeological Motor's ability to see intent in chaos.
 """
 
-import pandas as pd
+import numpy as np
 import hashlib
-from typing import Generator, List, Dict, Any
+import importlib.util
+from typing import TYPE_CHECKING, Generator, List, Dict, Any
 from pathlib import Path
 from .base_loader import BaseLoader, LoaderConfig, PraxeologicalTriple
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported inside load()/parse() so importing the loaders package
+# does not pay for it. pyarrow (optional: multithreaded CSV reader for large
+# exports) is only probed here; pandas imports it when the engine is used.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Record key carrying the (action, state) pair computed in parse()
+_DERIVED_KEY = "__asrs_action_state__"
+
+
+def _normalize_column(name: str) -> str:
+    """ASRS exports use uppercase, space-separated headers."""
+    return name.lower().replace(" ", "_")
+
 class ASRSLoader(BaseLoader):
     
+    # Normalized columns read by the triple/context/gene extraction (and the
+    # timestamp lookup in assemble_codons). Everything else in the export,
+    # mostly long free-text fields, is skipped at read time.
+    _USED_COLS = frozenset({
+        "acn", "anomaly", "assessment", "narrative",
+        "environment", "flight_phase", "location",
+        "timestamp", "time:timestamp",
+    })
+    
     @property
     def dataset_name(self) -> str:
         return "NASA ASRS (Aviation Safety Reporting System)"
@@ -32,16 +58,52 @@ class ASRSLoader(BaseLoader):
     def dataset_url(self) -> str:
         return "https://asrs.arc.nasa.gov/search/database.html"
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> "pd.DataFrame":
+        import pandas as pd
+        
         # Assuming CSV export from ASRS DB
         if not self.config.data_path.exists():
             raise FileNotFoundError(f"ASRS data not found at: {self.config.data_path}")
-        return pd.read_csv(self.config.data_path)
+        
+        # Header sniff: map the raw export names onto the columns we consume
+        header = pd.read_csv(self.config.data_path, nrows=0).columns
+        usecols = [c for c in header if _normalize_column(c) in self._USED_COLS]
+        
+        return pd.read_csv(
+            self.config.data_path,
+            usecols=usecols or None,
+            engine="pyarrow" if _HAS_PYARROW else "c"
+        )
 
-    def parse(self, raw_data: pd.DataFrame) -> List[Dict[str, Any]]:
+    def parse(self, raw_data: "pd.DataFrame") -> List[Dict[str, Any]]:
+        import pandas as pd
+        
         # Normalize columns (ASRS columns are usually uppercase)
-        raw_data.columns = [c.lower().replace(" ", "_") for c in raw_data.columns]
-        return raw_data.to_dict('records')
+        raw_data.columns = [_normalize_column(c) for c in raw_data.columns]
+        columns = list(raw_data.columns)
+        records = [
+            dict(zip(columns, row))
+            for row in raw_data.itertuples(index=False, name=None)
+        ]
+        
+        # Derive action/state for the whole frame in one vectorized pass;
+        # extract_triple picks them up instead of re-munging each record.
+        # Missing cells become "nan", as str() gives on the per-record path.
+        n = len(raw_data)
+        anomaly = raw_data["anomaly"] if "anomaly" in raw_data else pd.Series(["unknown_event"] * n)
+        actions = (
+            anomaly.fillna("nan").astype(str).str.split(";").str[0]
+            .str.strip().str.replace(" ", "_", regex=False).str.lower()
+        )
+        if "assessment" in raw_data:
+            critical = raw_data["assessment"].fillna("nan").astype(str).str.contains("Critical", regex=False)
+        else:
+            critical = pd.Series([False] * n)
+        states = np.where(critical.to_numpy(dtype=bool), "safety_compromised", "incident_reported")
+        
+        for record, action, state in zip(records, actions.tolist(), states.tolist()):
+            record[_DERIVED_KEY] = (action, state)
+        return records
 
     def extract_triple(self, record: Dict[str, Any]) -> PraxeologicalTriple:
         """
@@ -52,14 +114,20 @@ class ASRSLoader(BaseLoader):
         # Entity usually implies the reporter (Pilot/Controller)
         entity = "Flight_Crew" 
         
-        # Action derived from the anomaly type
-        action_raw = str(record.get('anomaly', 'unknown_event'))
-        action = action_raw.split(';')[0].strip().replace(" ", "_").lower()
-        
-        # State derived from outcome
-        state = "incident_reported"
-        if "Critical" in str(record.get('assessment', '')):
-            state = "safety_compromised"
+        # Action/State precomputed by parse(); removed from the record so the
+        # codon parameters keep the source columns only
+        derived = record.pop(_DERIVED_KEY, None)
+        if derived is not None:
+            action, state = derived
+        else:
+            # Action derived from the anomaly type
+            action_raw = str(record.get('anomaly', 'unknown_event'))
+            action = action_raw.split(';')[0].strip().replace(" ", "_").lower()
+            
+            # State derived from outcome
+            state = "incident_reported"
+            if "Critical" in str(record.get('assessment', '')):
+                state = "safety_compromised"
             
         return PraxeologicalTriple(
             entity=entity,
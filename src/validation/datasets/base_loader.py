@@ -27,15 +27,26 @@ License: MIT
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Iterator, Generator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Iterator, Generator
 from enum import Enum
 from pathlib import Path
+from datetime import datetime
+from itertools import islice
 import hashlib
 import json
+import math
+import sys
 import time
+import numpy as np
 import logging
 
+try:
+    import orjson  # Optional: C-backed JSON for large result files
+except ImportError:
+    orjson = None
+
 # Configure logging for the validation module
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +54,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger("validation.datasets")
 
+# Shared canonical encoder for codon UIDs and triple fingerprints. Same bytes
+# as json.dumps(sort_keys=True), without building an encoder per record.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, check_circular=False)
+
+
+# ============================================================================
+# CODON UID DIGESTS
+# ============================================================================
+
+# All produce 64 hex characters, the UID format validate_codon() expects
+UID_HASH_ALGORITHMS = ("sha256", "blake2b", "blake3")
+
+
+def _uid_hasher(algo: str) -> Callable[[bytes], str]:
+    """
+    Returns a bytes -> hex digest function for the configured UID algorithm.
+    
+    blake3 is an optional dependency and is imported only when selected.
+    """
+    if algo == "sha256":
+        return lambda data: hashlib.sha256(data).hexdigest()
+    if algo == "blake2b":
+        return lambda data: hashlib.blake2b(data, digest_size=32).hexdigest()
+    if algo == "blake3":
+        try:
+            import blake3
+        except ImportError as e:
+            raise ImportError(
+                "hash_algo='blake3' requires the blake3 package (pip install blake3)"
+            ) from e
+        return lambda data: blake3.blake3(data).hexdigest()
+    raise ValueError(f"Unsupported hash_algo: {algo!r}")
+
+
+def _codon_uid(
+    digest: Callable[[bytes], str],
+    entity: str,
+    action: str,
+    state: str,
+    timestamp: Any,
+    context: Dict[str, Any]
+) -> str:
+    """
+    Computes the deterministic codon UID (hash of content).
+    
+    The source string is json.dumps({action, context_hash, entity, state,
+    timestamp}, sort_keys=True), spelled out in key order so only the leaf
+    values go through the encoder; its bytes define every published UID.
+    Faster serializers (orjson) emit compact separators and their own float
+    formatting, so they cannot stand in here without re-keying every codon.
+
+    context_hash is deliberately not memoized: contexts carry per-event
+    position and amount fields and almost never repeat (1890 distinct in
+    1899 BPI events), and a tuple(sorted(items)) key would also conflate
+    1, 1.0 and True, which encode differently.
+    """
+    encode = _CANONICAL_ENCODER.encode
+    context_hash = digest(encode(context).encode())
+    uid_source = (
+        f'{{"action": {encode(action)}, '
+        f'"context_hash": "{context_hash}", '
+        f'"entity": {encode(entity)}, '
+        f'"state": {encode(state)}, '
+        f'"timestamp": {encode(timestamp)}}}'
+    )
+    return digest(uid_source.encode())
+
+
+def _codon_uid_chunk(hash_algo: str, items: List[Tuple[Any, ...]]) -> List[str]:
+    """Worker entry point: UIDs for (entity, action, state, timestamp, context) items."""
+    digest = _uid_hasher(hash_algo)
+    return [_codon_uid(digest, *item) for item in items]
+
+
+# Below this many codons, process start-up and pickling outweigh the hashing
+PARALLEL_MIN_CODONS = 10_000
+
 
 # ============================================================================
 # CONFIGURATION STRUCTURES
@@ -63,6 +151,14 @@ class LoaderConfig:
         validation_enabled: Whether to validate schema compliance
         max_records: Maximum number of records to process (None = all)
         random_seed: Seed for any stochastic operations (reproducibility)
+        hash_algo: Digest used for codon UIDs and hashed gene UIDs
+            ("sha256", "blake2b" or "blake3"). UIDs are content addresses,
+            not signatures; sha256 keeps existing datasets verifiable.
+        n_workers: Processes used to hash codon UIDs (1 = in-process).
+            Output is identical for any value.
+        encode_ids: Fill the integer id columns of result.columns (see
+            CodonBatch.encode_ids) and record the code -> id list as
+            metadata["id_vocabulary"]
     """
     data_path: Path
     output_path: Optional[Path] = None
@@ -70,6 +166,9 @@ class LoaderConfig:
     validation_enabled: bool = True
     max_records: Optional[int] = None
     random_seed: int = 42
+    hash_algo: str = "sha256"
+    n_workers: int = 1
+    encode_ids: bool = False
     
     def __post_init__(self):
         """Converts string paths to Path objects if necessary."""
@@ -77,17 +176,113 @@ class LoaderConfig:
             self.data_path = Path(self.data_path)
         if isinstance(self.output_path, str):
             self.output_path = Path(self.output_path)
+        if self.hash_algo not in UID_HASH_ALGORITHMS:
+            raise ValueError(
+                f"Unsupported hash_algo: {self.hash_algo!r} "
+                f"(expected one of {', '.join(UID_HASH_ALGORITHMS)})"
+            )
+        if self.n_workers < 1:
+            raise ValueError(f"n_workers must be >= 1, got {self.n_workers}")
     
     def to_dict(self) -> Dict[str, Any]:
-        """Serializes configuration for logging and reproducibility."""
-        return {
-            "data_path": str(self.data_path),
-            "output_path": str(self.output_path) if self.output_path else None,
-            "cache_enabled": self.cache_enabled,
-            "validation_enabled": self.validation_enabled,
-            "max_records": self.max_records,
-            "random_seed": self.random_seed
-        }
+        """
+        Serializes configuration for logging and reproducibility.
+        
+        Covers every dataclass field, including those added by subclasses,
+        in declaration order; paths are rendered as strings.
+        """
+        config = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            config[f.name] = str(value) if isinstance(value, Path) else value
+        return config
+
+
+@dataclass
+class CodonBatch:
+    """
+    Structure-of-arrays view over a list of codons.
+    
+    Scalar codon fields are held as parallel NumPy arrays (one entry per
+    codon, in codon order) so whole-result passes such as validation, UID
+    sorting and statistics run as array operations instead of one dict
+    lookup per codon. The variable-shape context stays a plain list. The
+    codon dicts remain the canonical form: genes embed them and results
+    serialize them, so a batch is built from codons, never the reverse.
+    
+    Attributes:
+        entity_ids: Codon entity_id values (object array)
+        action_ids: Codon action_id values (object array)
+        target_state_ids: Codon target_state_id values (object array)
+        timestamps: Codon timestamps (float64 when all are numeric)
+        sequence_positions: Position of each codon within its source order
+        confidences: Extraction confidence of each codon
+        uids: Codon UIDs (object array)
+        contexts: Codon context dictionaries
+        entity_codes: Integer codes of entity_ids (set by encode_ids)
+        action_codes: Integer codes of action_ids (set by encode_ids)
+        state_codes: Integer codes of target_state_ids (set by encode_ids)
+    """
+    entity_ids: np.ndarray
+    action_ids: np.ndarray
+    target_state_ids: np.ndarray
+    timestamps: np.ndarray
+    sequence_positions: np.ndarray
+    confidences: np.ndarray
+    uids: np.ndarray
+    contexts: List[Dict[str, Any]]
+    entity_codes: Optional[np.ndarray] = None
+    action_codes: Optional[np.ndarray] = None
+    state_codes: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_codons(cls, codons: List[Dict[str, Any]]) -> 'CodonBatch':
+        """Builds the column view of a codon list (missing fields become empty)."""
+        n = len(codons)
+        timestamps = [c.get("timestamp", 0.0) for c in codons]
+        try:
+            timestamp_col = np.array(timestamps, dtype=np.float64)
+        except (TypeError, ValueError):
+            timestamp_col = np.array(timestamps, dtype=object)
+        
+        return cls(
+            entity_ids=np.fromiter((c.get("entity_id", "") for c in codons), dtype=object, count=n),
+            action_ids=np.fromiter((c.get("action_id", "") for c in codons), dtype=object, count=n),
+            target_state_ids=np.fromiter((c.get("target_state_id", "") for c in codons), dtype=object, count=n),
+            timestamps=timestamp_col,
+            sequence_positions=np.array(
+                [c.get("sequence_position", -1) for c in codons], dtype=np.int64
+            ),
+            confidences=np.array(
+                [c.get("extraction_confidence", 0.0) for c in codons], dtype=np.float64
+            ),
+            uids=np.fromiter((c.get("uid", "") for c in codons), dtype=object, count=n),
+            contexts=[c.get("context", {}) for c in codons],
+        )
+    
+    def encode_ids(self, intern: Callable[[Any], int]) -> None:
+        """
+        Fills the *_codes columns from a shared string -> code vocabulary.
+        
+        Event logs repeat a few dozen resources and activities across
+        millions of codons; the codes let per-id counting use np.bincount
+        instead of string comparisons. Codes are uint16 while the
+        vocabulary fits, uint32 beyond that.
+        
+        Args:
+            intern: Maps an id to its code, assigning new codes as needed
+        """
+        n = len(self)
+        codes = [
+            np.fromiter(map(intern, column), dtype=np.int64, count=n)
+            for column in (self.entity_ids, self.action_ids, self.target_state_ids)
+        ]
+        top = max(int(c.max()) for c in codes) if n else 0
+        dtype = np.uint16 if top <= np.iinfo(np.uint16).max else np.uint32
+        self.entity_codes, self.action_codes, self.state_codes = (c.astype(dtype) for c in codes)
+    
+    def __len__(self) -> int:
+        return len(self.uids)
 
 
 @dataclass
@@ -105,6 +300,8 @@ class TransformationResult:
         statistics: Summary statistics of the transformed data
         warnings: Any issues encountered during transformation
         transformation_hash: Deterministic hash of the entire result
+        columns: CodonBatch (structure-of-arrays) view of the codons, built
+            on first access
     """
     codons: List[Dict[str, Any]]
     genes: List[Dict[str, Any]]
@@ -112,12 +309,23 @@ class TransformationResult:
     statistics: Dict[str, Any]
     warnings: List[str] = field(default_factory=list)
     transformation_hash: str = ""
+    # Producers that already built the column view (transform) may pass it in
+    _columns: Optional[CodonBatch] = field(
+        default=None, repr=False, compare=False
+    )
     
     def __post_init__(self):
         """Computes the deterministic hash after initialization."""
         if not self.transformation_hash:
             self.transformation_hash = self._compute_hash()
     
+    @property
+    def columns(self) -> CodonBatch:
+        """Column view of the codons, built once from the codons list."""
+        if self._columns is None:
+            self._columns = CodonBatch.from_codons(self.codons)
+        return self._columns
+    
     def _compute_hash(self) -> str:
         """
         Computes a deterministic hash of the transformation result.
@@ -125,12 +333,14 @@ class TransformationResult:
         This hash enables verification that two transformations of the
         same data with the same configuration produce identical results.
         """
-        # Create a canonical representation for hashing
+        # Create a canonical representation for hashing. This stays on the
+        # stdlib encoder (C-accelerated without indent): its exact byte layout
+        # defines every published transformation_hash.
         canonical = json.dumps({
             "codons_count": len(self.codons),
             "genes_count": len(self.genes),
-            "codon_hashes": sorted([c.get("uid", "") for c in self.codons]),
-            "gene_hashes": sorted([g.get("uid", "") for g in self.genes])
+            "codon_hashes": np.sort(np.array([c.get("uid", "") for c in self.codons], dtype=str)).tolist(),
+            "gene_hashes": np.sort(np.array([g.get("uid", "") for g in self.genes], dtype=str)).tolist()
         }, sort_keys=True)
         
         return hashlib.sha256(canonical.encode()).hexdigest()
@@ -146,17 +356,122 @@ class TransformationResult:
             "transformation_hash": self.transformation_hash
         }
     
+    def _pooled_dict(self) -> Dict[str, Any]:
+        """
+        Storage form of to_dict() with each source record written once.
+        
+        Codons share their "parameters" dict with the raw record, and genes
+        embed the same codon dicts, so a plain dump repeats every record at
+        least twice. Here records go to a top-level "source_records" list and
+        codons carry a "source_record_id" index into it instead.
+        """
+        records: List[Dict[str, Any]] = []
+        record_ids: Dict[int, int] = {}
+        
+        def pool(codon: Dict[str, Any]) -> Dict[str, Any]:
+            params = codon.get("parameters")
+            if not isinstance(params, dict):
+                return codon
+            rid = record_ids.get(id(params))
+            if rid is None:
+                rid = record_ids[id(params)] = len(records)
+                records.append(params)
+            slim = {k: v for k, v in codon.items() if k != "parameters"}
+            slim["source_record_id"] = rid
+            return slim
+        
+        data = self.to_dict()
+        data["codons"] = [pool(c) for c in self.codons]
+        data["genes"] = [
+            {**g, "codons": [pool(c) for c in g["codons"]]} if "codons" in g else g
+            for g in self.genes
+        ]
+        data["source_records"] = records
+        return data
+    
     def save(self, path: Path) -> None:
-        """Persists the result to a JSON file."""
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """
+        Persists the result to a JSON file.
+        
+        A '.jsonl' path is written in the line-delimited layout of
+        save_jsonl() instead.
+        """
+        path = Path(path)
+        if path.suffix == '.jsonl':
+            self.save_jsonl(path)
+            return
+        _write_json(self._pooled_dict(), path)
+        logger.info(f"Transformation result saved to {path}")
+    
+    def save_jsonl(self, path: Path) -> None:
+        """
+        Persists the result as JSON Lines plus a '.meta.json' sidecar.
+        
+        Each codon is encoded and written on its own line, so no document
+        holding every codon is ever built. The sidecar holds genes, metadata,
+        statistics, warnings and the transformation hash; gene codons that
+        are also in self.codons are stored as their line index.
+        
+        Args:
+            path: Destination of the codon lines; the sidecar is written
+                next to it with the suffix replaced by '.meta.json'
+        """
+        path = Path(path)
+        
+        def stdlib_dumps(codon: Dict[str, Any]) -> bytes:
+            return json.dumps(codon, default=_json_default).encode()
+        
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            
+            def dumps(codon: Dict[str, Any]) -> bytes:
+                # orjson writes NaN / Infinity as null, so only a line that
+                # contains null needs the (much slower) _has_non_finite walk
+                line = orjson.dumps(codon, option=option)
+                if b'null' in line and _has_non_finite(codon):
+                    return stdlib_dumps(codon)
+                return line
+        else:
+            dumps = stdlib_dumps
+        
+        line_of: Dict[int, int] = {}
+        with open(path, 'wb') as f:
+            for i, codon in enumerate(self.codons):
+                line_of[id(codon)] = i
+                f.write(dumps(codon))
+                f.write(b'\n')
+        
+        meta = self.to_dict()
+        del meta["codons"]
+        meta["codons_count"] = len(self.codons)
+        meta["genes"] = [
+            {**g, "codons": [line_of.get(id(c), c) for c in g["codons"]]}
+            if "codons" in g else g
+            for g in self.genes
+        ]
+        _write_json(meta, path.with_suffix('.meta.json'))
         logger.info(f"Transformation result saved to {path}")
     
     @classmethod
     def load(cls, path: Path) -> 'TransformationResult':
         """Loads a previously saved transformation result."""
-        with open(path, 'r') as f:
-            data = json.load(f)
+        path = Path(path)
+        if path.suffix == '.jsonl':
+            return cls._load_jsonl(path)
+        data = _read_json(path)
+        records = data.get("source_records")
+        if records is not None:
+            # Pooled layout written by save(): restore each codon's parameters
+            def unpool(codon: Dict[str, Any]) -> Dict[str, Any]:
+                rid = codon.pop("source_record_id", None)
+                if rid is not None:
+                    codon["parameters"] = records[rid]
+                return codon
+            for codon in data["codons"]:
+                unpool(codon)
+            for gene in data["genes"]:
+                for codon in gene.get("codons", ()):
+                    unpool(codon)
         return cls(
             codons=data["codons"],
             genes=data["genes"],
@@ -165,13 +480,102 @@ class TransformationResult:
             warnings=data.get("warnings", []),
             transformation_hash=data["transformation_hash"]
         )
+    
+    @classmethod
+    def _load_jsonl(cls, path: Path) -> 'TransformationResult':
+        """Loads a result written by save_jsonl()."""
+        with open(path, 'rb') as f:
+            codons = [_loads(line) for line in f if line.strip()]
+        meta = _read_json(path.with_suffix('.meta.json'))
+        for gene in meta["genes"]:
+            if "codons" in gene:
+                gene["codons"] = [
+                    codons[c] if isinstance(c, int) else c for c in gene["codons"]
+                ]
+        return cls(
+            codons=codons,
+            genes=meta["genes"],
+            metadata=meta["metadata"],
+            statistics=meta["statistics"],
+            warnings=meta.get("warnings", []),
+            transformation_hash=meta["transformation_hash"]
+        )
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """
+    True if obj holds a NaN or infinite float at any depth, including NumPy
+    float scalars and arrays. orjson writes those as null, so such payloads
+    go through the stdlib encoder, which keeps them as NaN / Infinity.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, (np.floating, np.ndarray)):
+            if item.dtype.kind == 'f' and not np.isfinite(item).all():
+                return True
+    return False
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Stdlib json fallback for the NumPy values orjson encodes natively
+    (OPT_SERIALIZE_NUMPY); arrays become lists.
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: bytes) -> Any:
+    """Parses one JSON document, through orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN / Infinity tokens from the stdlib encoder
+    return json.loads(data)
+
+
+def _write_json(data: Dict[str, Any], path: Path) -> None:
+    """
+    Writes an indented JSON document, through orjson when installed and
+    the payload has no non-finite floats.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """Reads a JSON document, through orjson when installed."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
 
 
 # ============================================================================
 # PRAXEOLOGICAL TRIPLE EXTRACTION
 # ============================================================================
 
-@dataclass
+# One triple exists per source record until its codon is assembled; on
+# Python 3.10+ they are slotted (no per-instance __dict__)
+_TRIPLE_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_TRIPLE_DATACLASS_OPTIONS)
 class PraxeologicalTriple:
     """
     The fundamental structure extracted from raw data: Entity → Action → State.
@@ -201,13 +605,39 @@ class PraxeologicalTriple:
             "entity": self.entity,
             "action": self.action,
             "state": self.state,
-            "source_record_hash": hashlib.sha256(
-                json.dumps(self.source_record, sort_keys=True).encode()
-            ).hexdigest()[:16],
+            # 64-bit provenance fingerprint (not a security boundary):
+            # BLAKE2b with an 8-byte digest, same 16 hex chars as before
+            "source_record_hash": hashlib.blake2b(
+                _CANONICAL_ENCODER.encode(self.source_record).encode(),
+                digest_size=8
+            ).hexdigest(),
             "confidence": self.confidence
         }
 
 
+# ============================================================================
+# TIMESTAMP PARSING
+# ============================================================================
+
+_UNPARSED = object()
+
+
+def _parse_iso_timestamp(value: str) -> Optional[float]:
+    """
+    Converts an ISO-8601 string to a Unix timestamp, or None if unparseable.
+    
+    Offsets (including 'Z') are honored; naive strings are local time, as
+    datetime.timestamp() defines them.
+    """
+    # fromisoformat is C-implemented: a hand-rolled slicing parser for the
+    # fixed XES layout measured ~2x slower. replace() returns the same
+    # object when there is no 'Z', so the common case allocates nothing.
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
 # ============================================================================
 # ABSTRACT BASE LOADER
 # ============================================================================
@@ -243,6 +673,9 @@ class BaseLoader(ABC):
             config: LoaderConfig instance with transformation parameters
         """
         self.config = config
+        self._uid_digest = _uid_hasher(config.hash_algo)
+        # Shared entity/action/state vocabulary (id string -> integer code)
+        self._id_vocab: Dict[Any, int] = {}
         self.raw_data: Optional[Any] = None
         self.parsed_data: Optional[List[Dict[str, Any]]] = None
         self._transformation_start: Optional[float] = None
@@ -300,6 +733,22 @@ class BaseLoader(ABC):
         """
         pass
     
+    def iter_records(self, raw_data: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the parsed records one at a time.
+        
+        The default iterates the list built by parse(). Loaders that can
+        produce records incrementally override this, which lets transform()
+        stop reading the source once max_records have been produced.
+        
+        Args:
+            raw_data: Data returned by load()
+            
+        Yields:
+            One dictionary per source record, as in parse()
+        """
+        return iter(self.parse(raw_data))
+    
     @abstractmethod
     def extract_triple(self, record: Dict[str, Any]) -> PraxeologicalTriple:
         """
@@ -332,6 +781,25 @@ class BaseLoader(ABC):
         """
         pass
     
+    def extract_triple_and_context(
+        self,
+        record: Dict[str, Any]
+    ) -> Tuple[PraxeologicalTriple, Dict[str, Any]]:
+        """
+        Extracts the triple and the context of a record in one call.
+        
+        The default delegates to extract_triple and extract_context.
+        Loaders whose two extractors read the same keys may override this
+        to visit the record once.
+        
+        Args:
+            record: A single parsed record
+            
+        Returns:
+            Tuple of (PraxeologicalTriple, context_dict)
+        """
+        return self.extract_triple(record), self.extract_context(record)
+    
     @abstractmethod
     def group_into_genes(
         self, 
@@ -360,7 +828,8 @@ class BaseLoader(ABC):
         triple: PraxeologicalTriple,
         context: Dict[str, Any],
         timestamp: float,
-        sequence_position: int
+        sequence_position: int,
+        uid: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Assembles a complete Praxeological Codon from extracted components.
@@ -374,6 +843,7 @@ class BaseLoader(ABC):
             context: Contextual features dictionary
             timestamp: Unix timestamp of the observation
             sequence_position: Position within the parent gene
+            uid: Precomputed UID (parallel assembly); computed here if None
             
         Returns:
             Complete codon dictionary conforming to schema
@@ -392,17 +862,12 @@ class BaseLoader(ABC):
         }
         
         # Compute the deterministic UID (hash of content)
-        uid_source = json.dumps({
-            "entity": codon["entity_id"],
-            "action": codon["action_id"],
-            "state": codon["target_state_id"],
-            "timestamp": codon["timestamp"],
-            "context_hash": hashlib.sha256(
-                json.dumps(context, sort_keys=True).encode()
-            ).hexdigest()
-        }, sort_keys=True)
-        
-        codon["uid"] = hashlib.sha256(uid_source.encode()).hexdigest()
+        if uid is None:
+            uid = _codon_uid(
+                self._uid_digest, triple.entity, triple.action, triple.state,
+                timestamp, context
+            )
+        codon["uid"] = uid
         
         return codon
     
@@ -422,11 +887,10 @@ class BaseLoader(ABC):
         Yields:
             Tuples of (PraxeologicalTriple, context_dict)
         """
+        extract = self.extract_triple_and_context
         for record in records:
             try:
-                triple = self.extract_triple(record)
-                context = self.extract_context(record)
-                yield (triple, context)
+                yield extract(record)
             except Exception as e:
                 logger.warning(f"Failed to extract triple from record: {e}")
                 continue
@@ -445,30 +909,75 @@ class BaseLoader(ABC):
             List of assembled codon dictionaries
         """
         codons = []
+        # (triple, context, timestamp, position) per extracted record
+        resolved: List[Tuple[PraxeologicalTriple, Dict[str, Any], Any, int]] = []
+        # ISO strings parsed so far; event logs repeat timestamps heavily
+        # (batched events, shared case start times)
+        parsed_timestamps: Dict[str, Optional[float]] = {}
         
         for i, (triple, context) in enumerate(self.extract_triples(records)):
             # Extract timestamp from source record or use sequence position
-            timestamp = triple.source_record.get(
-                "timestamp",
-                triple.source_record.get("time:timestamp", time.time())
-            )
+            record = triple.source_record
+            if "timestamp" in record:
+                timestamp = record["timestamp"]
+            elif "time:timestamp" in record:
+                timestamp = record["time:timestamp"]
+            else:
+                timestamp = time.time()
             
             # Handle various timestamp formats
             if isinstance(timestamp, str):
-                try:
-                    from datetime import datetime
-                    # Try ISO format first
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    timestamp = dt.timestamp()
-                except:
-                    timestamp = float(i)  # Fall back to sequence position
+                epoch = parsed_timestamps.get(timestamp, _UNPARSED)
+                if epoch is _UNPARSED:
+                    epoch = _parse_iso_timestamp(timestamp)
+                    parsed_timestamps[timestamp] = epoch
+                # Fall back to sequence position
+                timestamp = epoch if epoch is not None else float(i)
             
-            codon = self.assemble_codon(triple, context, timestamp, i)
-            codons.append(codon)
+            resolved.append((triple, context, timestamp, i))
+        
+        uids = self._parallel_uids(resolved)
+        for (triple, context, timestamp, i), uid in zip(resolved, uids):
+            codons.append(self.assemble_codon(triple, context, timestamp, i, uid))
         
         logger.info(f"Assembled {len(codons)} codons from {len(records)} records")
         return codons
     
+    def _parallel_uids(
+        self,
+        resolved: List[Tuple[PraxeologicalTriple, Dict[str, Any], Any, int]]
+    ) -> List[Optional[str]]:
+        """
+        Hashes codon UIDs across config.n_workers processes.
+        
+        Only the UID (the dominant per-codon cost) is computed in workers;
+        positions and timestamps are resolved beforehand and chunks are
+        rejoined in order, so the codons match an in-process run exactly.
+        Returns None placeholders (hash in assemble_codon) when the pool is
+        disabled, the input is small, or assemble_codon is overridden.
+        """
+        n_workers = self.config.n_workers
+        if (
+            n_workers == 1
+            or len(resolved) < PARALLEL_MIN_CODONS
+            or type(self).assemble_codon is not BaseLoader.assemble_codon
+        ):
+            return [None] * len(resolved)
+        
+        items = [
+            (triple.entity, triple.action, triple.state, timestamp, context)
+            for triple, context, timestamp, _ in resolved
+        ]
+        chunk_size = -(-len(items) // (n_workers * 4))
+        chunks = [items[k:k + chunk_size] for k in range(0, len(items), chunk_size)]
+        
+        logger.info(f"Hashing {len(items)} codon UIDs across {n_workers} processes")
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = executor.map(
+                _codon_uid_chunk, [self.config.hash_algo] * len(chunks), chunks
+            )
+            return [uid for chunk_uids in results for uid in chunk_uids]
+    
     def validate_codon(self, codon: Dict[str, Any]) -> List[str]:
         """
         Validates a codon against the schema requirements.
@@ -493,6 +1002,49 @@ class BaseLoader(ABC):
         
         return errors
     
+    def _intern(self, value: Any) -> int:
+        """Returns the vocabulary code of an id, assigning the next free one."""
+        return self._id_vocab.setdefault(value, len(self._id_vocab))
+    
+    def validate_codons_batch(self, batch: CodonBatch) -> np.ndarray:
+        """
+        Flags codons that fail the validate_codon() checks, as array passes.
+        
+        Args:
+            batch: Column view of the codons to validate
+            
+        Returns:
+            Boolean mask, True where the codon has at least one error
+        """
+        # Required fields must be truthy (object -> bool uses Python truthiness)
+        invalid = ~batch.entity_ids.astype(bool)
+        invalid |= ~batch.action_ids.astype(bool)
+        invalid |= ~batch.target_state_ids.astype(bool)
+        # UID format (64-char hex); a missing UID shows up as length 0
+        invalid |= np.fromiter(map(len, batch.uids), dtype=np.int64, count=len(batch)) != 64
+        return invalid
+    
+    def validate_genes_batch(self, genes: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Flags genes that fail the validate_gene() checks.
+        
+        Args:
+            genes: Gene dictionaries to validate
+            
+        Returns:
+            Boolean mask, True where the gene has at least one error
+        """
+        # One pass: a gene is suspect unless every required field is truthy
+        # (an empty codon list is falsy, covering the codon-count check too)
+        return np.fromiter(
+            (
+                not (g.get("uid") and g.get("name") and g.get("purpose") and g.get("codons"))
+                for g in genes
+            ),
+            dtype=bool,
+            count=len(genes)
+        )
+    
     def validate_gene(self, gene: Dict[str, Any]) -> List[str]:
         """
         Validates a gene against the schema requirements.
@@ -536,22 +1088,35 @@ class BaseLoader(ABC):
         
         # Step 2: Parse into records
         logger.info("Parsing raw data into records")
-        self.parsed_data = self.parse(self.raw_data)
-        
-        # Apply max_records limit if configured
+        # With max_records configured, read only as many records as needed
         if self.config.max_records:
-            self.parsed_data = self.parsed_data[:self.config.max_records]
+            self.parsed_data = list(islice(
+                self.iter_records(self.raw_data), self.config.max_records
+            ))
             logger.info(f"Limited to {self.config.max_records} records")
+        else:
+            self.parsed_data = self.parse(self.raw_data)
         
         # Step 3: Assemble codons
         logger.info("Assembling Praxeological Codons")
         codons = self.assemble_codons(self.parsed_data)
         
+        # Column view, built only for the passes that use it; otherwise
+        # result.columns builds it on first access
+        codon_batch: Optional[CodonBatch] = None
+        
         # Step 4: Validate codons if enabled
+        # The batch checks only locate failing codons; messages still come
+        # from validate_codon(). Loaders overriding it keep the full loop.
         if self.config.validation_enabled:
             logger.info("Validating codons")
-            for i, codon in enumerate(codons):
-                errors = self.validate_codon(codon)
+            if type(self).validate_codon is BaseLoader.validate_codon:
+                codon_batch = CodonBatch.from_codons(codons)
+                flagged = np.flatnonzero(self.validate_codons_batch(codon_batch)).tolist()
+            else:
+                flagged = range(len(codons))
+            for i in flagged:
+                errors = self.validate_codon(codons[i])
                 if errors:
                     warnings.extend([f"Codon {i}: {e}" for e in errors])
         
@@ -562,8 +1127,12 @@ class BaseLoader(ABC):
         # Step 6: Validate genes if enabled
         if self.config.validation_enabled:
             logger.info("Validating genes")
-            for i, gene in enumerate(genes):
-                errors = self.validate_gene(gene)
+            if type(self).validate_gene is BaseLoader.validate_gene:
+                flagged = np.flatnonzero(self.validate_genes_batch(genes)).tolist()
+            else:
+                flagged = range(len(genes))
+            for i in flagged:
+                errors = self.validate_gene(genes[i])
                 if errors:
                     warnings.extend([f"Gene {i}: {e}" for e in errors])
         
@@ -588,13 +1157,20 @@ class BaseLoader(ABC):
             "transformation_timestamp": time.time(),
             "validation_warnings_count": len(warnings)
         }
+        if self.config.encode_ids:
+            if codon_batch is None:
+                codon_batch = CodonBatch.from_codons(codons)
+            codon_batch.encode_ids(self._intern)
+            # Code -> id string for CodonBatch entity/action/state codes
+            metadata["id_vocabulary"] = list(self._id_vocab)
         
         result = TransformationResult(
             codons=codons,
             genes=genes,
             metadata=metadata,
             statistics=statistics,
-            warnings=warnings
+            warnings=warnings,
+            _columns=codon_batch
         )
         
         logger.info(f"Transformation complete: {statistics}")
@@ -44,16 +44,25 @@ License: MIT
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
-import hashlib
+from operator import itemgetter
 import json
 import time
 import logging
-import gzip
 import xml.etree.ElementTree as ET
 
+try:
+    from isal import igzip as gzip  # Optional: ISA-L gzip decompression
+except ImportError:
+    import gzip
+
+try:
+    from lxml import etree as lxml_etree  # Optional: faster XES streaming
+except ImportError:
+    lxml_etree = None
+
 from .base_loader import (
     BaseLoader,
     LoaderConfig,
@@ -86,17 +95,6 @@ class BPIConfig(LoaderConfig):
     min_events_per_case: int = 2
     activity_filter: Optional[List[str]] = None
     extract_offers: bool = True
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Serializes BPI-specific configuration."""
-        base = super().to_dict()
-        base.update({
-            "include_incomplete_cases": self.include_incomplete_cases,
-            "min_events_per_case": self.min_events_per_case,
-            "activity_filter": self.activity_filter,
-            "extract_offers": self.extract_offers
-        })
-        return base
 
 
 # ============================================================================
@@ -110,6 +108,80 @@ XES_NS = {
 }
 
 
+# XES default namespace, as it prefixes tags of namespaced logs
+_XES_NS_PREFIX = '{http://www.xes-standard.org/}'
+
+# <trace> tag with and without the XES namespace
+_XES_TRACE_TAGS = frozenset({'trace', _XES_NS_PREFIX + 'trace'})
+
+# <event> tag with and without the XES namespace
+_XES_EVENT_TAGS = frozenset({'event', _XES_NS_PREFIX + 'event'})
+
+# Attribute element types parse() reads into records, and their bare and
+# namespaced tags. Tags in other namespaces are still matched by suffix.
+_XES_VALUE_TYPES = ('string', 'int', 'float', 'date', 'boolean')
+_XES_VALUE_TAGS = frozenset(
+    prefix + t for t in _XES_VALUE_TYPES for prefix in ('', _XES_NS_PREFIX)
+)
+
+
+def _parse_xes_boolean(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# XES attribute types and their Python conversions. Types not listed here
+# ('string', 'date', 'id', ...) keep their raw string value; dates are
+# parsed later during codon assembly.
+_XES_CONVERTERS = {
+    'int': int,
+    'float': float,
+    'boolean': _parse_xes_boolean,
+}
+
+# Converter (or None) for every XES attribute tag, bare and namespaced, so
+# parse_xes_value resolves the common tags without stripping the namespace
+_XES_TAG_CONVERTERS = {
+    prefix + tag: _XES_CONVERTERS.get(tag)
+    for tag in ('string', 'date', 'int', 'float', 'boolean', 'id', 'list', 'container')
+    for prefix in ('', _XES_NS_PREFIX)
+}
+
+# Optional offer attributes copied into the codon context, as
+# (XES attribute, context key)
+_OFFER_CONTEXT_KEYS = (
+    ('OfferID', 'offer_id'),
+    ('NumberOfTerms', 'number_of_terms'),
+    ('MonthlyCost', 'monthly_cost'),
+    ('CreditScore', 'credit_score'),
+    ('FirstWithdrawalAmount', 'first_withdrawal'),
+)
+
+# Low-cardinality attributes whose string values iter_records shares across
+# records. Everything else (case ids, timestamps, event and offer ids) is
+# near-unique and stays unpooled, so the pool cannot grow with the log.
+# At trace level concept:name is the case id, hence the separate sets.
+_CASE_CATEGORICAL_KEYS = frozenset({'LoanGoal', 'ApplicationType'})
+_EVENT_CATEGORICAL_KEYS = frozenset({'org:resource', 'concept:name', 'lifecycle:transition'})
+
+# Distinguishes an absent attribute from one whose value is None
+_MISSING = object()
+
+# Sort key for codons within a case
+_BY_TIMESTAMP = itemgetter('timestamp')
+
+# Case outcome rules in precedence order, as (sentinel activity, status,
+# offer_accepted, application_accepted); see _determine_case_outcome
+_OUTCOME_RULES = (
+    ('A_Denied', 'denied', None, False),
+    ('A_Cancelled', 'cancelled', None, False),
+    ('O_Accepted', 'accepted', True, True),
+    ('O_Refused', 'refused', False, True),  # App was accepted, offer refused
+    ('O_Cancelled', 'offer_cancelled', False, True),
+    ('O_Created', 'pending_offer_response', None, True),  # No final response yet
+    ('A_Accepted', 'pending_offer', None, True),
+)
+
+
 def parse_xes_value(element: ET.Element) -> Tuple[str, Any]:
     """
     Extracts key-value pair from an XES attribute element.
@@ -117,6 +189,12 @@ def parse_xes_value(element: ET.Element) -> Tuple[str, Any]:
     XES stores attributes as typed elements (<string>, <int>, <date>, etc.)
     with 'key' and 'value' attributes.
     
+    Not memoized: dates and strings are returned unconverted, so a
+    (tag, key, value) cache would only save the odd int()/float() call
+    (under 10% of this function's time) while growing with every distinct
+    amount and offer id in the log. Repeated timestamps are memoized at
+    codon assembly, where they are actually parsed.
+    
     Args:
         element: An XES attribute element
         
@@ -126,24 +204,17 @@ def parse_xes_value(element: ET.Element) -> Tuple[str, Any]:
     key = element.get('key', '')
     value = element.get('value', '')
     
-    # Type conversion based on element tag
-    tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-    
-    if tag == 'int':
+    # Type conversion based on element tag; the namespace is stripped only
+    # for tags outside the precomputed table
+    converter = _XES_TAG_CONVERTERS.get(element.tag, _MISSING)
+    if converter is _MISSING:
+        converter = _XES_CONVERTERS.get(element.tag.rpartition('}')[2])
+    if converter is not None:
         try:
-            value = int(value)
+            value = converter(value)
         except ValueError:
+            # Malformed numeric values are kept as the raw string
             pass
-    elif tag == 'float':
-        try:
-            value = float(value)
-        except ValueError:
-            pass
-    elif tag == 'boolean':
-        value = value.lower() == 'true'
-    elif tag == 'date':
-        # Keep as string for now; will be parsed during codon assembly
-        pass
     
     return key, value
 
@@ -204,6 +275,17 @@ class BPILoader(BaseLoader):
         # BPI-specific state
         self._case_outcomes: Dict[str, Dict[str, Any]] = {}
         self._activity_counts: Dict[str, int] = defaultdict(int)
+        # One shared string per distinct action_lifecycle state id; there
+        # are a few dozen, against one codon per event
+        self._state_ids: Dict[str, str] = {}
+        
+        # The fused extractor below mirrors extract_triple/extract_context;
+        # subclasses overriding either one keep the two-call path
+        cls = type(self)
+        self._fused_extract = (
+            cls.extract_triple is BPILoader.extract_triple
+            and cls.extract_context is BPILoader.extract_context
+        )
     
     # ========================================================================
     # ABSTRACT METHOD IMPLEMENTATIONS
@@ -227,14 +309,15 @@ class BPILoader(BaseLoader):
     def dataset_url(self) -> str:
         return "https://data.4tu.nl/articles/dataset/BPI_Challenge_2017/12696884"
     
-    def load(self) -> ET.Element:
+    def load(self) -> Path:
         """
-        Loads the XES file and returns the root element.
+        Checks the XES source and returns its path.
         
-        Handles both plain XES and gzipped XES files.
+        The document itself is streamed by parse(), so the full XML tree
+        is never held in memory. Handles both plain XES and gzipped XES files.
         
         Returns:
-            ElementTree root element containing the log
+            Path to the XES (or .xes.gz) file
         """
         path = self.config.data_path
         
@@ -244,21 +327,68 @@ class BPILoader(BaseLoader):
                 f"Download from: {self.dataset_url}"
             )
         
-        logger.info(f"Loading XES file: {path}")
+        logger.info(f"Streaming XES file: {path}")
         
-        # Handle gzipped files
-        if path.suffix == '.gz':
-            with gzip.open(path, 'rt', encoding='utf-8') as f:
-                tree = ET.parse(f)
-        else:
-            tree = ET.parse(path)
+        return path
+    
+    def _iter_traces(self, raw_data: Any) -> Iterator[ET.Element]:
+        """
+        Yields complete <trace> elements from an XES source.
         
-        root = tree.getroot()
-        logger.info(f"Loaded XES log with {len(list(root))} top-level elements")
+        A path is read incrementally with iterparse (lxml when installed,
+        else the stdlib parser); each trace is released once consumed, so
+        peak memory is bounded by one case rather than the whole log. An
+        already-parsed root element is also accepted.
         
-        return root
-    
-    def parse(self, raw_data: ET.Element) -> List[Dict[str, Any]]:
+        Args:
+            raw_data: Path to the XES file, or root element of the XES document
+        """
+        if isinstance(raw_data, ET.Element):
+            # Handle namespace variations in XES files
+            traces = raw_data.findall('.//trace', XES_NS)
+            if not traces:
+                traces = raw_data.findall('.//{http://www.xes-standard.org/}trace')
+            if not traces:
+                # Try without namespace
+                traces = raw_data.findall('.//trace')
+            yield from traces
+            return
+        
+        path = Path(raw_data)
+        source = gzip.open(path, 'rb') if path.suffix == '.gz' else open(path, 'rb')
+        
+        if lxml_etree is not None:
+            # libxml2 parser; only <trace> end events reach Python
+            with source:
+                for _, elem in lxml_etree.iterparse(
+                    source,
+                    events=('end',),
+                    tag=tuple(_XES_TRACE_TAGS),
+                    remove_comments=True,
+                    remove_pis=True,
+                    # Lift libxml2's per-node size/depth safety limits, which
+                    # multi-GB event logs can trip; sources are local files
+                    # chosen by the caller
+                    huge_tree=True
+                ):
+                    yield elem
+                    # Release the consumed trace and any earlier siblings
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+            return
+        
+        with source:
+            context = ET.iterparse(source, events=('start', 'end'))
+            # The first event is the start of the root <log>
+            _, root = next(context)
+            for event, elem in context:
+                if event == 'end' and elem.tag in _XES_TRACE_TAGS:
+                    yield elem
+                    # Drop the consumed trace from the partially built tree
+                    root.clear()
+    
+    def parse(self, raw_data: Any) -> List[Dict[str, Any]]:
         """
         Parses XES XML into a list of event records.
         
@@ -276,31 +406,68 @@ class BPILoader(BaseLoader):
         </log>
         
         Args:
-            raw_data: Root element of the XES document
+            raw_data: Path returned by load() (or a parsed XES root element)
             
         Returns:
             List of event dictionaries with case context included
         """
-        events = []
+        return list(self.iter_records(raw_data))
+    
+    def iter_records(self, raw_data: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Yields event records as their traces are read (see parse()).
         
-        # Find all traces (cases)
-        # Handle namespace variations in XES files
-        traces = raw_data.findall('.//trace', XES_NS)
-        if not traces:
-            traces = raw_data.findall('.//{http://www.xes-standard.org/}trace')
-        if not traces:
-            # Try without namespace
-            traces = raw_data.findall('.//trace')
+        Traces are consumed lazily, so a caller that stops early (such as
+        transform() with max_records) never reads the rest of the log.
         
-        logger.info(f"Found {len(traces)} traces (cases) in log")
+        Runs in-process: farming traces out to workers needs them
+        re-serialized here, and iterparse plus ET.tostring alone already
+        costs more than this whole loop (n_workers applies to UID hashing).
         
-        for trace_idx, trace in enumerate(traces):
-            # Extract case-level attributes
+        Args:
+            raw_data: Path returned by load() (or a parsed XES root element)
+            
+        Yields:
+            Event dictionaries with case context included
+        """
+        n_events = 0
+        n_traces = 0
+        
+        # Locals for the per-attribute loops
+        activity_counts = self._activity_counts
+        activity_filter = self.config.activity_filter
+        value_tags = _XES_VALUE_TAGS
+        value_types = _XES_VALUE_TYPES
+        case_categorical = _CASE_CATEGORICAL_KEYS
+        event_categorical = _EVENT_CATEGORICAL_KEYS
+        # One shared object per distinct attribute key and categorical value:
+        # resources, activities and lifecycle states repeat across every
+        # event, but the XML parser allocates a fresh string each time
+        pool = {}
+        shared = pool.setdefault
+        
+        for trace_idx, trace in enumerate(self._iter_traces(raw_data)):
+            n_traces += 1
+            # Extract case-level attributes and collect the trace's events
+            # in one pass over its children
             case_attrs = {}
-            for attr in trace:
-                if attr.tag.endswith(('string', 'int', 'float', 'date', 'boolean')):
-                    key, value = parse_xes_value(attr)
+            trace_events = []
+            for child in trace:
+                tag = child.tag
+                if tag in _XES_EVENT_TAGS:
+                    trace_events.append(child)
+                elif tag in value_tags or tag.endswith(value_types):
+                    key, value = parse_xes_value(child)
+                    key = shared(key, key)
+                    if key in case_categorical and value.__class__ is str:
+                        value = shared(value, value)
                     case_attrs[key] = value
+            if not trace_events:
+                # Non-standard logs may nest events below the trace level
+                trace_events = (
+                    trace.findall('.//{http://www.xes-standard.org/}event')
+                    or trace.findall('.//event')
+                )
             
             case_id = case_attrs.get('concept:name', f'case_{trace_idx}')
             
@@ -311,40 +478,47 @@ class BPILoader(BaseLoader):
                 'RequestedAmount': case_attrs.get('RequestedAmount'),
             }
             
-            # Find all events in this trace
-            trace_events = trace.findall('.//{http://www.xes-standard.org/}event')
-            if not trace_events:
-                trace_events = trace.findall('.//event')
+            # Case context shared by every event of the trace; copying a
+            # prebuilt dict is a single table copy per event instead of one
+            # insert per case attribute
+            case_record = {'case_id': case_id}
+            case_record.update(case_attrs)
             
+            case_length = len(trace_events)
             for event_idx, event in enumerate(trace_events):
-                # Extract event-level attributes
-                event_attrs = {'case_id': case_id}
-                event_attrs.update(case_attrs)  # Include case context
+                # Extract event-level attributes on top of the case context
+                event_attrs = case_record.copy()
                 
                 for attr in event:
-                    if attr.tag.endswith(('string', 'int', 'float', 'date', 'boolean')):
+                    tag = attr.tag
+                    if tag in value_tags or tag.endswith(value_types):
                         key, value = parse_xes_value(attr)
+                        key = shared(key, key)
+                        if key in event_categorical and value.__class__ is str:
+                            value = shared(value, value)
                         event_attrs[key] = value
                 
                 # Add sequence position within case
                 event_attrs['_sequence_position'] = event_idx
-                event_attrs['_case_length'] = len(trace_events)
+                event_attrs['_case_length'] = case_length
                 
                 # Track activity for statistics
                 activity = event_attrs.get('concept:name', 'Unknown')
-                self._activity_counts[activity] += 1
+                activity_counts[activity] += 1
                 
                 # Apply activity filter if configured
-                if self.config.activity_filter:
-                    if activity not in self.config.activity_filter:
+                if activity_filter:
+                    if activity not in activity_filter:
                         continue
                 
-                events.append(event_attrs)
-        
-        logger.info(f"Parsed {len(events)} events from {len(traces)} cases")
-        logger.info(f"Activity distribution: {dict(self._activity_counts)}")
+                n_events += 1
+                yield event_attrs
         
-        return events
+        logger.info(f"Parsed {n_events} events from {n_traces} cases")
+        # The distribution spans every activity seen; render it only if it
+        # will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Activity distribution: %s", dict(self._activity_counts))
     
     def extract_triple(self, record: Dict[str, Any]) -> PraxeologicalTriple:
         """
@@ -379,8 +553,10 @@ class BPILoader(BaseLoader):
         # Construct a meaningful state from action + lifecycle
         # This captures the teleological outcome of this atomic step
         state = f"{action}_{lifecycle}"
+        state = self._state_ids.setdefault(state, state)
         
-        # Confidence is based on data completeness
+        # Confidence is based on data completeness. Plain compares: in
+        # CPython two string == tests beat two dict.get() lookups here.
         confidence = 1.0
         if entity == 'AutomatedSystem':
             confidence *= 0.9  # Slightly less certain about automated actors
@@ -411,39 +587,96 @@ class BPILoader(BaseLoader):
         Returns:
             Dictionary of contextual features for the codon
         """
-        context = {}
-        
-        # Case-level context (static throughout the case)
-        context['application_type'] = record.get('ApplicationType', 'Unknown')
-        context['loan_goal'] = record.get('LoanGoal', 'Unknown')
-        context['requested_amount'] = record.get('RequestedAmount', 0)
-        
-        # Process position context
-        context['sequence_position'] = record.get('_sequence_position', 0)
-        context['case_length'] = record.get('_case_length', 1)
-        context['relative_position'] = (
-            record.get('_sequence_position', 0) / 
-            max(record.get('_case_length', 1), 1)
-        )
-        
-        # Resource context
-        context['resource'] = record.get('org:resource', 'Unknown')
-        context['lifecycle'] = record.get('lifecycle:transition', 'complete')
+        get = record.get
+        position = get('_sequence_position', 0)
+        case_length = get('_case_length', 1)
+        
+        context = {
+            # Case-level context (static throughout the case)
+            'application_type': get('ApplicationType', 'Unknown'),
+            'loan_goal': get('LoanGoal', 'Unknown'),
+            'requested_amount': get('RequestedAmount', 0),
+            # Process position context
+            'sequence_position': position,
+            'case_length': case_length,
+            'relative_position': position / max(case_length, 1),
+            # Resource context
+            'resource': get('org:resource', 'Unknown'),
+            'lifecycle': get('lifecycle:transition', 'complete'),
+        }
         
         # Offer-related context (specific to BPI 2017)
-        if 'OfferID' in record:
-            context['offer_id'] = record['OfferID']
-        if 'NumberOfTerms' in record:
-            context['number_of_terms'] = record['NumberOfTerms']
-        if 'MonthlyCost' in record:
-            context['monthly_cost'] = record['MonthlyCost']
-        if 'CreditScore' in record:
-            context['credit_score'] = record['CreditScore']
-        if 'FirstWithdrawalAmount' in record:
-            context['first_withdrawal'] = record['FirstWithdrawalAmount']
+        for key, name in _OFFER_CONTEXT_KEYS:
+            if key in record:
+                context[name] = record[key]
         
         return context
     
+    def extract_triple_and_context(
+        self,
+        record: Dict[str, Any]
+    ) -> Tuple[PraxeologicalTriple, Dict[str, Any]]:
+        """
+        Fused extract_triple + extract_context for a BPI event.
+        
+        Both extractors read the resource, lifecycle and position
+        attributes; this reads each of them once per event and builds the
+        same triple and context (including key order) as the two separate
+        calls.
+        
+        Args:
+            record: A single parsed event dictionary
+            
+        Returns:
+            Tuple of (PraxeologicalTriple, context_dict)
+        """
+        if not self._fused_extract:
+            return super().extract_triple_and_context(record)
+        
+        get = record.get
+        resource = get('org:resource', _MISSING)
+        action = get('concept:name', 'UnknownActivity')
+        lifecycle = get('lifecycle:transition', 'complete')
+        position = get('_sequence_position', 0)
+        case_length = get('_case_length', 1)
+        
+        # Triple (see extract_triple for the mapping rationale)
+        entity = 'System' if resource is _MISSING else resource
+        if not entity or entity == 'None':
+            entity = 'AutomatedSystem'
+        
+        confidence = 1.0
+        if entity == 'AutomatedSystem':
+            confidence *= 0.9
+        if action == 'UnknownActivity':
+            confidence *= 0.5
+        
+        state = f"{action}_{lifecycle}"
+        triple = PraxeologicalTriple(
+            entity=entity,
+            action=action,
+            state=self._state_ids.setdefault(state, state),
+            source_record=record,
+            confidence=confidence
+        )
+        
+        # Context (see extract_context)
+        context = {
+            'application_type': get('ApplicationType', 'Unknown'),
+            'loan_goal': get('LoanGoal', 'Unknown'),
+            'requested_amount': get('RequestedAmount', 0),
+            'sequence_position': position,
+            'case_length': case_length,
+            'relative_position': position / max(case_length, 1),
+            'resource': 'Unknown' if resource is _MISSING else resource,
+            'lifecycle': lifecycle,
+        }
+        for key, name in _OFFER_CONTEXT_KEYS:
+            if key in record:
+                context[name] = record[key]
+        
+        return triple, context
+    
     def group_into_genes(
         self,
         codons: List[Dict[str, Any]]
@@ -467,7 +700,9 @@ class BPILoader(BaseLoader):
         Returns:
             List of gene dictionaries
         """
-        # Group codons by case ID
+        # Group codons by case ID. Hash grouping plus a per-case sort (below)
+        # is ~3x faster than one global (case, timestamp) sort + groupby, and
+        # keeps genes in order of first appearance.
         cases: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         
         for codon in codons:
@@ -475,14 +710,21 @@ class BPILoader(BaseLoader):
             cases[case_id].append(codon)
         
         genes = []
+        uid_digest = self._uid_digest
         
         for case_id, case_codons in cases.items():
             # Skip cases with too few events
             if len(case_codons) < self.config.min_events_per_case:
                 continue
             
-            # Sort codons by timestamp
-            case_codons.sort(key=lambda c: c.get('timestamp', 0))
+            # Sort codons by timestamp. assemble_codon always sets it, so the
+            # C-level itemgetter applies; list.sort computes every key before
+            # reordering, so a codon without one leaves the list untouched
+            # for the defaulting fallback.
+            try:
+                case_codons.sort(key=_BY_TIMESTAMP)
+            except KeyError:
+                case_codons.sort(key=lambda c: c.get('timestamp', 0))
             
             # Determine case outcome (ground truth)
             outcome = self._determine_case_outcome(case_codons)
@@ -500,10 +742,9 @@ class BPILoader(BaseLoader):
             loan_goal = case_context.get('loan_goal', 'Unknown')
             purpose = f"Process loan application for {loan_goal}"
             
-            # Compute gene UID from case ID
-            gene_uid = hashlib.sha256(
-                f"bpi2017:gene:{case_id}".encode()
-            ).hexdigest()
+            # Compute gene UID from case ID, with the same configured digest
+            # as the codon UIDs (SHA-256 unless hash_algo says otherwise)
+            gene_uid = uid_digest(f"bpi2017:gene:{case_id}".encode())
             
             # Determine activation conditions from first activity
             first_activity = first_codon.get('action_id', '')
@@ -565,6 +806,10 @@ class BPILoader(BaseLoader):
         This ground truth allows us to validate whether M_P correctly
         identifies cases where intention was vs wasn't realized.
         
+        Not memoized per process variant: keying on the case's action
+        sequence costs the same single pass as the set build below, and
+        each gene still needs its own outcome dict.
+        
         Args:
             case_codons: List of codons for a single case
             
@@ -573,6 +818,7 @@ class BPILoader(BaseLoader):
         """
         # Collect all activities in the case
         activities = [c.get('action_id', '') for c in case_codons]
+        seen = set(activities)
         
         outcome = {
             'status': 'incomplete',
@@ -581,38 +827,13 @@ class BPILoader(BaseLoader):
             'application_accepted': None
         }
         
-        # Check for definitive outcomes
-        if 'A_Denied' in activities:
-            outcome['status'] = 'denied'
-            outcome['application_accepted'] = False
-            
-        elif 'A_Cancelled' in activities:
-            outcome['status'] = 'cancelled'
-            outcome['application_accepted'] = False
-            
-        elif 'O_Accepted' in activities:
-            outcome['status'] = 'accepted'
-            outcome['offer_accepted'] = True
-            outcome['application_accepted'] = True
-            
-        elif 'O_Refused' in activities:
-            outcome['status'] = 'refused'
-            outcome['offer_accepted'] = False
-            outcome['application_accepted'] = True  # App was accepted, offer refused
-            
-        elif 'O_Cancelled' in activities:
-            outcome['status'] = 'offer_cancelled'
-            outcome['offer_accepted'] = False
-            outcome['application_accepted'] = True
-            
-        elif 'O_Created' in activities:
-            # Offer was created but no final response
-            outcome['status'] = 'pending_offer_response'
-            outcome['application_accepted'] = True
-            
-        elif 'A_Accepted' in activities:
-            outcome['status'] = 'pending_offer'
-            outcome['application_accepted'] = True
+        # First sentinel activity in precedence order decides the outcome
+        for activity, status, offer_accepted, application_accepted in _OUTCOME_RULES:
+            if activity in seen:
+                outcome['status'] = status
+                outcome['offer_accepted'] = offer_accepted
+                outcome['application_accepted'] = application_accepted
+                break
         
         return outcome
     
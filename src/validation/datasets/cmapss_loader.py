@@ -4,17 +4,26 @@ cmapss_loader.py
 Loader for NASA C-MAPSS Turbofan Degradation Dataset.
 """
 
-import pandas as pd
-from typing import Generator, List, Dict, Any
+from typing import TYPE_CHECKING, Generator, List, Dict, Any
 from pathlib import Path
 import logging
+import numpy as np
 
 # FIX: Absolute imports to prevent "attempted relative import" errors
 from validation.datasets.base_loader import BaseLoader, LoaderConfig, PraxeologicalTriple
 from digital_genome_core import SafetyLevel, OperationalGene, PraxeologicalCodon
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger("validation.datasets.cmapss")
 
+# Record key carrying the degradation state computed in parse()
+_DERIVED_KEY = "__cmapss_state__"
+
+# Static pressure (s11) above which a cycle is labelled degraded
+_S11_DEGRADED = 47.5
+
 class CMAPSSConfig(LoaderConfig):
     """Configuration specific to C-MAPSS data structure."""
     columns: List[str] = [
@@ -38,30 +47,58 @@ class CMAPSSLoader(BaseLoader):
         # Using a reliable direct link for the zip file
         return "https://data.nasa.gov/api/views/xaut-bemq/rows.csv?accessType=DOWNLOAD"
 
-    def load(self) -> pd.DataFrame:
+    def load(self) -> "pd.DataFrame":
+        import pandas as pd  # Deferred: only needed once a load actually runs
         if not self.config.data_path.exists():
             raise FileNotFoundError(f"C-MAPSS data not found at: {self.config.data_path}")
         
-        # C-MAPSS text files are space-separated
+        # C-MAPSS text files are space-separated, with trailing spaces on
+        # each line. pandas maps sep=r"\s+" onto the C tokenizer's
+        # whitespace mode; engine='c' pins that (an unsupported option now
+        # raises instead of silently falling back to the Python engine).
+        # dtypes stay inferred: integer-valued sensors keep int values and
+        # float columns keep full float64 precision in the codon records.
         df = pd.read_csv(
             self.config.data_path, 
             sep=r"\s+", 
             header=None, 
-            names=self.config.columns
+            names=self.config.columns,
+            engine='c'
         )
         return df
 
-    def parse(self, raw_data: pd.DataFrame) -> List[Dict[str, Any]]:
-        return raw_data.to_dict('records')
+    def parse(self, raw_data: "pd.DataFrame") -> List[Dict[str, Any]]:
+        # Rows assembled from whole-column tolist() calls: same native
+        # ints/floats as to_dict('records'), about twice as fast
+        names = list(raw_data.columns)
+        records = [
+            dict(zip(names, row))
+            for row in zip(*(raw_data[name].tolist() for name in names))
+        ]
+        
+        # Degradation state for every cycle in one vectorized compare
+        # (NaN readings compare False and stay nominal, as in extract_triple).
+        # This is already a native loop over the column, so a JIT kernel
+        # (numba) would add a dependency and compile time for no gain.
+        if 's11' in raw_data.columns:
+            degraded = raw_data['s11'].to_numpy(dtype=float) > _S11_DEGRADED
+            states = np.where(degraded, "degraded", "nominal").tolist()
+            for record, state in zip(records, states):
+                record[_DERIVED_KEY] = state
+        return records
 
     def extract_triple(self, record: Dict[str, Any]) -> PraxeologicalTriple:
         unit_id = f"Turbofan_Unit_{int(record['unit_number'])}"
         
-        # Simple threshold logic for state (s11 is static pressure)
-        # In production, this would be a trained anomaly detector
-        state = "nominal"
-        if record.get('s11', 0) > 47.5: 
-            state = "degraded"
+        # State precomputed by parse(); removed from the record so the codon
+        # parameters keep the sensor columns only
+        state = record.pop(_DERIVED_KEY, None)
+        if state is None:
+            # Simple threshold logic for state (s11 is static pressure)
+            # In production, this would be a trained anomaly detector
+            state = "nominal"
+            if record.get('s11', 0) > _S11_DEGRADED:
+                state = "degraded"
         
         return PraxeologicalTriple(
             entity=unit_id,
@@ -82,6 +119,9 @@ class CMAPSSLoader(BaseLoader):
         }
 
     def group_into_genes(self, codons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Keyed by unit number rather than a list indexed by it: units are
+        # read from the file (not guaranteed dense or integral) and genes
+        # follow first appearance; the dict costs <10% over direct indexing
         genes_map = {}
         
         for codon in codons:
@@ -45,14 +45,26 @@ All experiments are designed for full reproducibility:
 - Results include confidence intervals
 """
 
-from .exp_praxeological import (
-    PraxeologicalExperiment,
-    PraxeologicalHypothesis,
-    run_praxeological_validation
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exp_praxeological import (
+        PraxeologicalExperiment,
+        PraxeologicalHypothesis,
+        run_praxeological_validation
+    )
 
 __all__ = [
     'PraxeologicalExperiment',
     'PraxeologicalHypothesis',
     'run_praxeological_validation',
 ]
+
+
+def __getattr__(name):
+    # Experiments pull in the motors and the dataset loaders; load them on
+    # first use so importing the package (or a sibling) stays cheap (PEP 562)
+    if name in __all__:
+        from . import exp_praxeological
+        return getattr(exp_praxeological, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -408,7 +408,8 @@ def compare_with_baseline(
     baseline_name: str = "Baseline",
     dg_scores: Optional[List[float]] = None,
     baseline_scores: Optional[List[float]] = None,
-    alpha: float = 0.05
+    alpha: float = 0.05,
+    dg_metrics: Optional[PredictionMetrics] = None
 ) -> BaselineComparison:
     """
     Compares Digital Genome predictions against a baseline method.
@@ -425,14 +426,18 @@ def compare_with_baseline(
         dg_scores: Optional DG prediction scores
         baseline_scores: Optional baseline prediction scores
         alpha: Significance level for hypothesis test
+        dg_metrics: Precomputed metrics for dg_predictions, e.g. when the
+            same predictions are compared against several baselines
+            (evaluated here if None)
         
     Returns:
         BaselineComparison with metrics and statistical tests
     """
     # Evaluate both methods
-    dg_metrics = evaluate_predictions(
-        dg_predictions, ground_truth, dg_scores
-    )
+    if dg_metrics is None:
+        dg_metrics = evaluate_predictions(
+            dg_predictions, ground_truth, dg_scores
+        )
     baseline_metrics = evaluate_predictions(
         baseline_predictions, ground_truth, baseline_scores
     )
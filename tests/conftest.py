@@ -0,0 +1,9 @@
+"""
+Shared pytest setup: the modules under test live in src/ and import each
+other as top-level packages (``unl_core``, ``validation...``).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
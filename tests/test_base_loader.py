@@ -0,0 +1,79 @@
+"""
+Tests for TransformationResult persistence (src/validation/datasets/base_loader.py).
+"""
+
+import math
+
+import numpy as np
+
+from validation.datasets.base_loader import TransformationResult
+
+
+def _result_with_non_finite_context():
+    codons = [
+        {"uid": "a" * 64, "entity_id": "e1", "action_id": "report", "state_id": "s",
+         "context": {"severity": float("nan"), "altitude": float("inf")},
+         "parameters": {"raw": float("nan")}},
+        {"uid": "b" * 64, "entity_id": "e2", "action_id": "report", "state_id": "s",
+         "context": {"severity": 0.5, "altitude": -float("inf")},
+         "parameters": {"raw": 1.0}},
+    ]
+    genes = [{"gene_id": "g1", "codons": list(codons)}]
+    return TransformationResult(codons=codons, genes=genes, metadata={}, statistics={})
+
+
+def _assert_context_survives(loaded):
+    first, second = loaded.codons[0], loaded.codons[1]
+    assert math.isnan(first["context"]["severity"])
+    assert first["context"]["altitude"] == float("inf")
+    assert math.isnan(first["parameters"]["raw"])
+    assert second["context"] == {"severity": 0.5, "altitude": -float("inf")}
+    assert math.isnan(loaded.genes[0]["codons"][0]["context"]["severity"])
+
+
+def test_save_load_json_keeps_non_finite_values(tmp_path):
+    """NaN and +/-Inf must not come back as None."""
+    result = _result_with_non_finite_context()
+    path = tmp_path / "result.json"
+    result.save(path)
+    loaded = TransformationResult.load(path)
+    _assert_context_survives(loaded)
+    assert loaded.transformation_hash == result.transformation_hash
+
+
+def test_save_load_jsonl_keeps_non_finite_values(tmp_path):
+    """The line-delimited layout must round-trip NaN context values too."""
+    result = _result_with_non_finite_context()
+    path = tmp_path / "result.jsonl"
+    result.save(path)
+    loaded = TransformationResult.load(path)
+    _assert_context_survives(loaded)
+    assert loaded.genes[0]["codons"][1] == loaded.codons[1]
+    assert loaded.transformation_hash == result.transformation_hash
+
+
+def test_save_load_json_keeps_non_finite_numpy_values(tmp_path):
+    """NumPy float scalars and arrays are checked for NaN / Inf too."""
+    result = _result_with_non_finite_context()
+    result.metadata["sensor"] = {
+        "gain": np.float32("nan"),
+        "readings": np.array([1.0, np.nan, -np.inf]),
+    }
+    path = tmp_path / "result.json"
+    result.save(path)
+    sensor = TransformationResult.load(path).metadata["sensor"]
+    assert math.isnan(sensor["gain"])
+    assert sensor["readings"][0] == 1.0
+    assert math.isnan(sensor["readings"][1])
+    assert sensor["readings"][2] == -float("inf")
+
+
+def test_save_load_jsonl_keeps_non_finite_numpy_values(tmp_path):
+    result = _result_with_non_finite_context()
+    result.codons[1]["context"]["gain"] = np.float32("nan")
+    result.codons[1]["context"]["readings"] = np.array([np.inf, 2.0])
+    path = tmp_path / "result.jsonl"
+    result.save(path)
+    context = TransformationResult.load(path).codons[1]["context"]
+    assert math.isnan(context["gain"])
+    assert context["readings"] == [float("inf"), 2.0]
@@ -0,0 +1,59 @@
+"""
+Tests for the praxeological validation experiment
+(src/validation/experiments/exp_praxeological.py).
+"""
+
+from pathlib import Path
+
+from validation.experiments.exp_praxeological import (
+    ExperimentConfig,
+    PraxeologicalExperiment,
+    calculate_praxeological_scores,
+    generate_synthetic_genes,
+)
+
+
+def _synthetic_experiment(tmp_path):
+    config = ExperimentConfig(
+        data_path=Path("/tmp/synthetic"),  # Not used for synthetic
+        output_dir=tmp_path,
+        random_seed=42
+    )
+    experiment = PraxeologicalExperiment(config)
+    genes = generate_synthetic_genes(n_genes=200, seed=42)
+    
+    def load_data():
+        experiment.genes = genes
+    experiment.load_data = load_data
+    return experiment
+
+
+def test_run_scores_test_split_like_per_split_scoring(tmp_path):
+    """run() looks test scores up from the all-genes pass by gene identity."""
+    experiment = _synthetic_experiment(tmp_path)
+    seen = {}
+    run_evaluation = experiment.run_evaluation
+    
+    def capture(scores=None):
+        seen["scores"] = list(scores)
+        return run_evaluation(scores)
+    experiment.run_evaluation = capture
+    
+    results = experiment.run()
+    assert seen["scores"] == calculate_praxeological_scores(experiment.test_genes)
+    
+    # Same seed, same split, test split scored on its own
+    reference = _synthetic_experiment(tmp_path)
+    reference.load_data()
+    reference.split_data()
+    assert results["main_metrics"] == reference.run_evaluation().to_dict()
+
+
+def test_calculate_scores_pairs_genes_with_cp_results(tmp_path):
+    """The per-gene API keeps returning (gene, CPResult) pairs."""
+    experiment = _synthetic_experiment(tmp_path)
+    genes = generate_synthetic_genes(n_genes=50, seed=7)
+    scored = experiment.calculate_scores(genes)
+    assert [gene for gene, _ in scored] == genes
+    assert [result.craft_performance for _, result in scored] == \
+        calculate_praxeological_scores(genes)
@@ -0,0 +1,111 @@
+"""
+Tests for the UNL signal-topology engine (src/unl_core.py).
+"""
+
+import weakref
+
+import numpy as np
+import pytest
+
+import unl_core
+from unl_core import OntologyType, UNLEngine, _hist10
+
+
+# Damped oscillation quantized to 0.1: several samples sit exactly on bin
+# edges, which scale-and-truncate alone puts in the wrong bin.
+EDGE_SIGNAL = [0.5, 1.0, 1.4, 1.4, 1.2, 0.8, 0.2, -0.1,
+               -0.4, -0.4, -0.1, 0.5, 1.0, 1.3, 1.6, 1.0]
+
+
+def _reference_entropy(signal):
+    """Entropy exactly as the engine originally computed it."""
+    hist, _ = np.histogram(signal, bins=10, density=True)
+    hist = hist[hist > 0]
+    return -np.sum(hist * np.log(hist))
+
+
+def _edge_cases():
+    rng = np.random.default_rng(0)
+    cases = [np.array(EDGE_SIGNAL), np.full(12, 3.0), np.array([0.0, 1.0]),
+             np.linspace(-1.0, 1.0, 11), np.linspace(0.0, 0.9, 10)]
+    for _ in range(500):
+        n = int(rng.integers(2, 40))
+        cases.append(np.round(rng.normal(size=n), 1))
+        cases.append(rng.integers(0, 4, n) * 0.25)
+    return cases
+
+
+def test_hist10_matches_np_histogram():
+    """Bins and edges must be identical to np.histogram(bins=10)."""
+    for x in _edge_cases():
+        counts, edges = _hist10(x[None, :])
+        ref_counts, ref_edges = np.histogram(x, bins=10)
+        np.testing.assert_array_equal(counts[0], ref_counts)
+        np.testing.assert_array_equal(edges[0], ref_edges)
+
+
+def test_hist10_rows_match_single_signal():
+    """A stacked batch bins each row as if it were alone."""
+    X = np.stack([x for x in _edge_cases() if x.size == 16])
+    counts, _ = _hist10(X)
+    for row, x in zip(counts, X):
+        np.testing.assert_array_equal(row, np.histogram(x, bins=10)[0])
+
+
+def test_hist10_rejects_non_finite_range():
+    with pytest.raises(ValueError):
+        _hist10(np.array([[1.0, np.nan, 2.0]]))
+
+
+def test_entropy_matches_np_histogram_density():
+    engine = UNLEngine()
+    for x in _edge_cases():
+        assert engine._calculate_entropy(x) == pytest.approx(_reference_entropy(x), rel=1e-12)
+
+
+def test_edge_signal_keeps_machine_agency():
+    """Mis-binned edges used to push this signal past the entropy threshold."""
+    result = UNLEngine().infer_agency_from_signal(EDGE_SIGNAL)
+    assert result.entropy == pytest.approx(1.753286, abs=1e-6)
+    assert result.agency_type == OntologyType.MACHINE
+
+
+def test_signature_cache_is_shared_and_bounded():
+    """Engines share one cache, hold no reference to it, and skip long signals."""
+    unl_core._signature_cache.clear()
+    short = list(np.sin(np.arange(32)))
+    long = list(np.sin(np.arange(unl_core.SIGNATURE_CACHE_MAX_LEN + 1)))
+    
+    engine = UNLEngine()
+    first = engine.infer_agency_from_signal(short)
+    engine.infer_agency_from_signal(long)
+    assert list(unl_core._signature_cache.values()) == [first]
+    assert UNLEngine().infer_agency_from_signal(short) is first
+    
+    ref = weakref.ref(engine)
+    del engine
+    assert ref() is None
+
+
+def test_classify_batch_matches_infer_agency():
+    """classify_batch is the bulk form of infer_agency_from_signal(...).agency_type."""
+    rng = np.random.default_rng(1)
+    signals = [[], [0.0] * 8, [3.0] * 8, [5.0], [float("nan")], EDGE_SIGNAL,
+               list(np.sin(np.arange(16))), [0.0, 0.0, 1.0, 0.0, 0.0, 0.0]]
+    for _ in range(300):
+        n = int(rng.integers(1, 24))
+        signals.append(list(np.round(rng.normal(1.0, 1.0, size=n), 1)))
+        signals.append(list(rng.exponential(size=n) * (rng.random(n) < 0.3)))
+    engine = UNLEngine()
+    expected = [engine.infer_agency_from_signal(s).agency_type for s in signals]
+    assert engine.classify_batch(signals) == expected
+
+
+def test_classify_batch_rejects_nan_like_infer_agency():
+    """A NaN inside a multi-sample signal has no histogram range in either path."""
+    signal = [1.0, float("nan"), 2.0]
+    engine = UNLEngine()
+    with pytest.raises(ValueError):
+        engine.infer_agency_from_signal(signal)
+    with pytest.raises(ValueError):
+        engine.classify_batch([[1.0, 2.0, 3.0], signal])